@@ -4,12 +4,14 @@ Wrapper for ImperialDynastyGame.
 Adds:
 - --scenario <file>: temporarily swap any scenario JSON into the slot main.py expects.
 - --auto-end: start the game and automatically exit (sends 'end' to stdin).
+- --seed <int>: enable reproducible outcome variance (passed to main.py as IMPERIAL_SEED).
 
 Keeps main.py unchanged.
 """
 
 from __future__ import annotations
 import argparse
+import os
 import pathlib
 import shutil
 import subprocess
@@ -45,11 +47,14 @@ def temporary_swap(target: pathlib.Path, source: pathlib.Path | None):
                 pass
 
 
-def run_game(auto_end: bool) -> int:
+def run_game(auto_end: bool, seed: int | None = None) -> int:
     cmd = [sys.executable, "main.py"]
+    env = dict(os.environ)
+    if seed is not None:
+        env["IMPERIAL_SEED"] = str(seed)
     if not auto_end:
-        return subprocess.call(cmd)
-    p = subprocess.Popen(cmd, stdin=subprocess.PIPE, text=True)
+        return subprocess.call(cmd, env=env)
+    p = subprocess.Popen(cmd, stdin=subprocess.PIPE, text=True, env=env)
     try:
         p.communicate("end\n", timeout=15)
     except Exception:
@@ -64,6 +69,7 @@ def parse_args() -> argparse.Namespace:
     ap = argparse.ArgumentParser(description="ImperialDynastyGame launcher")
     ap.add_argument("--scenario", help="Path to scenario JSON to run.")
     ap.add_argument("--auto-end", action="store_true", help="Auto-exit (sends 'end').")
+    ap.add_argument("--seed", type=int, help="Seed for reproducible outcome variance.")
     return ap.parse_args()
 
 
@@ -71,7 +77,7 @@ def main() -> int:
     args = parse_args()
     scenario_path = pathlib.Path(args.scenario).resolve() if args.scenario else None
     with temporary_swap(HARDCODED_SCENARIO, scenario_path):
-        return run_game(args.auto_end)
+        return run_game(args.auto_end, args.seed)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,127 @@
+# engine/autosave.py
+import threading
+import time
+from pathlib import Path
+from typing import List, Optional
+
+from engine.loader import write_json_atomic
+
+# Tunables
+AUTOSAVE_EVERY_TURNS = 5  # autosave after this many resolved turns
+AUTOSAVE_INTERVAL_SECONDS = 60.0  # ...or once this much time has passed since the last one
+
+
+class AutosaveWriter:
+    """
+    Single background writer for the turn log.
+
+    The turn loop hands over snapshots with `maybe_save`/`submit`; the writer thread
+    only ever writes the most recent one, so a burst of turns costs one disk write.
+    Turns not yet saved are written by the thread itself once the time window
+    expires, even if no further turn resolves. Writes go through
+    `write_json_atomic`, so the save on disk is always a complete file.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        every_turns: int = AUTOSAVE_EVERY_TURNS,
+        interval_seconds: float = AUTOSAVE_INTERVAL_SECONDS,
+    ):
+        self.path = Path(path)
+        self.every_turns = every_turns
+        self.interval_seconds = interval_seconds
+
+        self._cond = threading.Condition()
+        self._pending: Optional[List[dict]] = None
+        self._dirty: Optional[List[dict]] = None  # latest unsaved log, for the time trigger
+        self._writing = False
+        self._closed = False
+        self._turns_since_save = 0
+        self._last_save = time.monotonic()
+
+        self._thread = threading.Thread(target=self._run, name="autosave", daemon=True)
+        self._thread.start()
+
+    def maybe_save(self, log: List[dict]):
+        """
+        Called once per resolved turn. Queues a snapshot once the turn threshold is
+        reached; otherwise marks the log dirty so the writer thread saves it when the
+        time threshold expires. Never waits on disk.
+        """
+        # Why: entries are never mutated after being appended, so a shallow copy is a snapshot.
+        snapshot = list(log)
+        with self._cond:
+            if self._closed:
+                return
+            self._turns_since_save += 1
+            if self.every_turns and self._turns_since_save >= self.every_turns:
+                self._queue(snapshot)
+            else:
+                self._dirty = snapshot
+            self._cond.notify_all()
+
+    def submit(self, log: List[dict]):
+        """Queue a snapshot of the log, replacing any snapshot not yet written."""
+        snapshot = list(log)
+        with self._cond:
+            if self._closed:
+                return
+            self._queue(snapshot)
+            self._cond.notify_all()
+
+    def flush(self):
+        """Write any unsaved turns and block until every queued snapshot is on disk."""
+        with self._cond:
+            if self._dirty is not None:
+                self._queue(self._dirty)
+                self._cond.notify_all()
+            while self._pending is not None or self._writing:
+                self._cond.wait()
+
+    def close(self):
+        """Write any pending or unsaved snapshot and stop the writer thread."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        self._thread.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def _queue(self, snapshot: List[dict]):
+        # Caller holds self._cond.
+        self._pending = snapshot
+        self._dirty = None
+        self._turns_since_save = 0
+        self._last_save = time.monotonic()
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while self._pending is None and not self._closed:
+                    if self._dirty is None or not self.interval_seconds:
+                        self._cond.wait()
+                        continue
+                    remaining = self._last_save + self.interval_seconds - time.monotonic()
+                    if remaining <= 0:
+                        self._queue(self._dirty)
+                    else:
+                        self._cond.wait(remaining)
+                if self._pending is None and self._dirty is not None:
+                    self._queue(self._dirty)  # closing: don't drop unsaved turns
+                if self._pending is None:
+                    return
+                snapshot, self._pending = self._pending, None
+                self._writing = True
+            try:
+                write_json_atomic(snapshot, self.path)
+            except Exception as e:
+                print(f"❌ Autosave failed: {e}")
+            finally:
+                with self._cond:
+                    self._writing = False
+                    self._cond.notify_all()
@@ -1,7 +1,10 @@
 # engine/decision.py
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
+import math
 import re
 
+from engine.variance import turn_uniforms
+
 # Tunables
 PERFECT_MATCH_THRESHOLD = 0.50  # 50% keyword overlap to count as "perfect action"
 LOWER_VARIANCE = 0.10  # ±10%  variance when applying perfect outcome
@@ -66,8 +69,31 @@ def match_perfect_action(order: str, perfect_block: dict):
 
 
 def apply_small_variance(
-    effect: Dict[str, Any], variance: float = LOWER_VARIANCE
+    effect: Dict[str, Any],
+    variance: float = LOWER_VARIANCE,
+    seed: Optional[int] = None,
+    session: int = 0,
+    turn: int = 0,
 ) -> Dict[str, Any]:
-    # Deterministic (no RNG) —  keep outcomes stable for good ideas
-
-    return effect
+    """
+    Scales each numeric effect by a factor in [1 - variance, 1 + variance).
+    Without a seed this is a no-op, so default play stays deterministic.
+    Draws are keyed on (seed, session, turn), so replays and parallel runs match exactly.
+    Integers use stochastic rounding, so small stats (|value| <= 4) still vary.
+    Returns a new dict; perfect-run effects are shared and must not be mutated.
+    """
+    if seed is None or not variance:
+        return effect
+
+    keys = sorted(k for k, v in effect.items() if isinstance(v, (int, float)))
+    # First len(keys) draws pick each factor; the next len(keys) do the rounding.
+    draws = turn_uniforms(seed, session, turn, 2 * len(keys))
+    varied = dict(effect)
+    for i, k in enumerate(keys):
+        scaled = effect[k] * (1 + variance * (2 * draws[i] - 1))
+        if isinstance(effect[k], int):
+            # Why: plain round() snaps anything within ±0.5 back, cancelling ±10% on small stats.
+            varied[k] = math.floor(scaled + draws[len(keys) + i])
+        else:
+            varied[k] = scaled
+    return varied
@@ -1,8 +1,15 @@
 # engine/loader.py
 import json
+import os
+import tempfile
 from pathlib import Path
 from typing import Dict, Any, Tuple
 
+# Read once at import: os.umask() can only be queried by setting it, which is not
+# safe once the autosave thread is running.
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
 
 def load_save_state(scenario: dict, save_path: str):
     """
@@ -32,7 +39,10 @@ def load_save_state(scenario: dict, save_path: str):
 
 def load_json(path: Path) -> Dict[str, Any]:
     with path.open("r", encoding="utf-8") as f:
-        return json.load(f)
+        data = json.load(f)
+    if not isinstance(data, dict):
+        raise ValueError(f"{path.name}: expected a JSON object, got {type(data).__name__}")
+    return data
 
 
 def load_engine(core_path: Path) -> Dict[str, Any]:
@@ -77,13 +87,39 @@ def get_player_handles(scenario: Dict[str, Any]) -> Tuple[str, Dict[str, Any]]:
     return pf, fdata
 
 
+def write_json_atomic(data: Any, path: Path):
+    """
+    Writes JSON to a temp file in the same directory, fsyncs it, then renames it
+    over the target. A crash mid-write leaves the previous file intact.
+    """
+    path = Path(path)
+    try:
+        mode = path.stat().st_mode & 0o7777
+    except FileNotFoundError:
+        mode = 0o666 & ~_UMASK
+    fd, tmp_name = tempfile.mkstemp(prefix=f".{path.name}.", suffix=".tmp", dir=path.parent)
+    try:
+        # Why: mkstemp creates 0600 and os.replace keeps it; match what open("w") gave.
+        os.chmod(tmp_name, mode)
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_name, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise
+
+
 def save_game_state(log: list, path: Path):
     """
     Writes the current turn log to a save file.
     """
     try:
-        with path.open("w", encoding="utf-8") as f:
-            json.dump(log, f, indent=2)
+        write_json_atomic(log, path)
         print(f"\n💾 Game saved successfully to {path.name}")
     except Exception as e:
         print(f"❌ Error saving game: {e}")
@@ -0,0 +1,175 @@
+# engine/reload.py
+import copy
+import threading
+from pathlib import Path
+from typing import Dict, Any, Optional, Set, Tuple
+
+from engine.loader import load_engine, load_scenario, load_perfect_run, select_perfect_block
+
+Signature = Tuple[int, int]  # (mtime_ns, size)
+
+
+def file_signature(path: Path) -> Optional[Signature]:
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+class ContentSnapshot:
+    """
+    One immutable version of the game content. Sessions grab a snapshot when they
+    start and keep it; reloads build a new snapshot instead of editing this one.
+    """
+
+    def __init__(
+        self,
+        engine: Dict[str, Any],
+        perfect_run: Dict[str, Any],
+        scenarios: Dict[str, Dict[str, Any]],
+        perfect_blocks: Dict[str, Dict[str, Any]],
+        version: int = 1,
+    ):
+        self.engine = engine
+        self.perfect_run = perfect_run
+        self.scenarios = scenarios  # keyed by scenario file name
+        self.perfect_blocks = perfect_blocks  # keyed by scenario file name
+        self.version = version
+
+    def scenario(self, name: str) -> Dict[str, Any]:
+        """Private copy of a scenario; the game loop mutates its save_state."""
+        return copy.deepcopy(self.scenarios[name])
+
+
+class ContentStore:
+    """
+    Holds the current ContentSnapshot and refreshes it by polling file mtime/size.
+
+    Long-running hosts call `poll()` between turns. Only the artifacts derived from
+    changed files are rebuilt, and the new snapshot is swapped in with one assignment.
+    """
+
+    def __init__(self, core_path: Path, perfect_run_path: Path, scenario_dir: Path):
+        self.core_path = Path(core_path)
+        self.perfect_run_path = Path(perfect_run_path)
+        self.scenario_dir = Path(scenario_dir)
+        self._lock = threading.Lock()
+        self._signatures: Dict[Path, Signature] = {}
+        self._failed: Dict[Path, Signature] = {}  # bad files, retried once they change again
+        self.load_errors: Dict[str, str] = {}  # file name -> why its last load failed
+
+        # Why: stat before loading, so an edit landing mid-load is seen by the next poll.
+        self._signatures[self.core_path] = file_signature(self.core_path)
+        engine = load_engine(self.core_path)
+        self._signatures[self.perfect_run_path] = file_signature(self.perfect_run_path)
+        perfect_run = load_perfect_run(self.perfect_run_path)
+        # A bad scenario file is skipped, not fatal: it has nothing to do with the others.
+        scenarios = {}
+        perfect_blocks = {}
+        for path in self._scenario_paths():
+            loaded = self._try_load(load_scenario, path, initial=True)
+            if loaded is None:
+                continue
+            scenarios[path.name], self._signatures[path] = loaded
+            perfect_blocks[path.name] = select_perfect_block(scenarios[path.name], perfect_run)
+        self._current = ContentSnapshot(engine, perfect_run, scenarios, perfect_blocks)
+
+    def current(self) -> ContentSnapshot:
+        return self._current
+
+    def _scenario_paths(self):
+        return sorted(self.scenario_dir.glob("*.json"))
+
+    def _changed(self, path: Path) -> bool:
+        sig = file_signature(path)
+        return sig != self._signatures.get(path) and sig != self._failed.get(path)
+
+    def _try_load(
+        self, loader, path: Path, initial: bool = False
+    ) -> Optional[Tuple[Dict[str, Any], Signature]]:
+        """
+        Stat then load one file. Returns (data, signature), or None if the file is
+        unreadable or not a JSON object (bad encoding, mid-save, wrong shape).
+        The reason is kept in `load_errors` until the file loads cleanly.
+        """
+        sig = file_signature(path)
+        try:
+            data = loader(path)
+        except (OSError, ValueError) as e:
+            if initial:
+                print(f"⚠️ Skipped {path.name} at startup: {e}")
+            else:
+                print(f"⚠️ Reload skipped for {path.name}: {e}")
+            self._failed[path] = sig
+            self.load_errors[path.name] = str(e)
+            return None
+        self._failed.pop(path, None)
+        self.load_errors.pop(path.name, None)
+        return data, sig
+
+    def poll(self) -> Set[str]:
+        """
+        Reload whatever changed on disk since the last poll.
+        Returns the names of the files that were picked up.
+        A file that fails to load (caught mid-save, bad encoding, not a JSON object)
+        keeps its old version and is retried once it changes again.
+        """
+        with self._lock:
+            old = self._current
+            engine = old.engine
+            perfect_run = old.perfect_run
+            scenarios = dict(old.scenarios)
+            perfect_blocks = dict(old.perfect_blocks)
+            picked_up: Dict[Path, Optional[Signature]] = {}
+
+            if self._changed(self.core_path):
+                loaded = self._try_load(load_engine, self.core_path)
+                if loaded is not None:
+                    engine, picked_up[self.core_path] = loaded
+
+            rebuild_all_blocks = False
+            if self._changed(self.perfect_run_path):
+                loaded = self._try_load(load_perfect_run, self.perfect_run_path)
+                if loaded is not None:
+                    perfect_run, picked_up[self.perfect_run_path] = loaded
+                    rebuild_all_blocks = True
+
+            current_paths = self._scenario_paths()
+            for path in current_paths:
+                if not self._changed(path):
+                    continue
+                loaded = self._try_load(load_scenario, path)
+                if loaded is None:
+                    continue
+                scenarios[path.name], picked_up[path] = loaded
+                perfect_blocks[path.name] = select_perfect_block(scenarios[path.name], perfect_run)
+
+            removed = [
+                p
+                for p in self._signatures
+                if p.parent == self.scenario_dir and p not in current_paths
+            ]
+            for path in removed:
+                scenarios.pop(path.name, None)
+                perfect_blocks.pop(path.name, None)
+                picked_up[path] = None
+
+            if rebuild_all_blocks:
+                perfect_blocks = {
+                    name: select_perfect_block(scn, perfect_run) for name, scn in scenarios.items()
+                }
+
+            if not picked_up:
+                return set()
+
+            for path, sig in picked_up.items():
+                if sig is None:
+                    self._signatures.pop(path, None)
+                else:
+                    self._signatures[path] = sig
+            # Why: one reference assignment; readers see the old or new snapshot, never a mix.
+            self._current = ContentSnapshot(
+                engine, perfect_run, scenarios, perfect_blocks, version=old.version + 1
+            )
+            return {p.name for p in picked_up}
@@ -0,0 +1,95 @@
+# engine/variance.py
+"""
+Counter-based randomness (Philox4x32-10) for outcome variance.
+
+Every draw is a pure function of (seed, session, turn, index), so any turn can be
+computed on its own, in any order, on any worker, and a replay with the same seed
+reproduces exactly. There is no RNG state to share or advance.
+"""
+
+from typing import List, Tuple
+
+MASK32 = 0xFFFFFFFF
+PHILOX_M0 = 0xD2511F53
+PHILOX_M1 = 0xCD9E8D57
+PHILOX_W0 = 0x9E3779B9
+PHILOX_W1 = 0xBB67AE85
+PHILOX_ROUNDS = 10
+
+
+def philox4x32(
+    counter: Tuple[int, int, int, int], key: Tuple[int, int], rounds: int = PHILOX_ROUNDS
+) -> Tuple[int, int, int, int]:
+    """One Philox4x32 block: four 32-bit counter words + two key words -> four 32-bit words."""
+    c0, c1, c2, c3 = counter
+    k0, k1 = key
+    for i in range(rounds):
+        if i:
+            k0 = (k0 + PHILOX_W0) & MASK32
+            k1 = (k1 + PHILOX_W1) & MASK32
+        p0 = PHILOX_M0 * c0
+        p1 = PHILOX_M1 * c2
+        c0, c1, c2, c3 = (
+            ((p1 >> 32) ^ c1 ^ k0) & MASK32,
+            p1 & MASK32,
+            ((p0 >> 32) ^ c3 ^ k1) & MASK32,
+            p0 & MASK32,
+        )
+    return c0, c1, c2, c3
+
+
+def _key(seed: int) -> Tuple[int, int]:
+    return seed & MASK32, (seed >> 32) & MASK32
+
+
+def _counter(session: int, turn: int, block: int) -> Tuple[int, int, int, int]:
+    return turn & MASK32, session & MASK32, (session >> 32) & MASK32, block & MASK32
+
+
+def turn_uniforms(seed: int, session: int, turn: int, n: int) -> List[float]:
+    """n uniform floats in [0, 1) for one (seed, session, turn)."""
+    out: List[float] = []
+    block = 0
+    while len(out) < n:
+        words = philox4x32(_counter(session, turn, block), _key(seed))
+        out.extend(w / 2**32 for w in words)
+        block += 1
+    return out[:n]
+
+
+def turn_uniforms_batch(seed: int, session: int, turns, n: int):
+    """
+    Vectorized `turn_uniforms` over a batch of turns.
+    Returns a NumPy array of shape (len(turns), n); row i equals turn_uniforms(..., turns[i], n).
+    Requires NumPy.
+    """
+    import numpy as np
+
+    # Why: go through int64 so negative turns wrap like the serial `turn & MASK32`.
+    turns = np.asarray(turns, dtype=np.int64).astype(np.uint64) & np.uint64(MASK32)
+    n_blocks = max(1, -(-n // 4))
+    # One row per (turn, block) pair.
+    c0 = np.repeat(turns, n_blocks)
+    c1 = np.full_like(c0, session & MASK32)
+    c2 = np.full_like(c0, (session >> 32) & MASK32)
+    c3 = np.tile(np.arange(n_blocks, dtype=np.uint64), len(turns))
+    k0, k1 = (np.uint64(k) for k in _key(seed))
+    mask = np.uint64(MASK32)
+    shift = np.uint64(32)
+    m0, m1 = np.uint64(PHILOX_M0), np.uint64(PHILOX_M1)
+    w0, w1 = np.uint64(PHILOX_W0), np.uint64(PHILOX_W1)
+    for i in range(PHILOX_ROUNDS):
+        if i:
+            k0 = (k0 + w0) & mask
+            k1 = (k1 + w1) & mask
+        # Why: both factors are < 2**32, so the 64-bit product never overflows.
+        p0 = m0 * c0
+        p1 = m1 * c2
+        c0, c1, c2, c3 = (
+            ((p1 >> shift) ^ c1 ^ k0) & mask,
+            p1 & mask,
+            ((p0 >> shift) ^ c3 ^ k1) & mask,
+            p0 & mask,
+        )
+    words = np.stack([c0, c1, c2, c3], axis=1).reshape(len(turns), n_blocks * 4)
+    return words[:, :n].astype(np.float64) / 2**32
@@ -0,0 +1,275 @@
+"""
+Fuzz and throughput harness for the order pipeline.
+
+Generates adversarial free-text orders (empty, whitespace, unicode, very long,
+keyword floods, near-misses) plus odd calendar years and resource keys, runs them
+across a process pool, and checks invariants:
+- tokenize / classify_category / match_perfect_action / apply_effects never crash
+- every result is deterministic (a second run gives the same answer)
+- match_perfect_action stays under --budget-ms per order
+- parse_year / advance_year never produce year 0 and calendar_distance stays consistent
+
+Each case is generated from (seed, case index) alone, so a run is reproducible for
+any --jobs. Every run writes --out with its parameters and any violations, so
+each finding can be regenerated from (seed, max_len, case) as a regression case.
+
+Usage:
+  python fuzz_orders.py --cases 20000 --jobs 4 --budget-ms 50
+"""
+
+from __future__ import annotations
+import argparse
+import contextlib
+import io
+import os
+import pathlib
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from engine.decisions import tokenize, classify_category, match_perfect_action
+from engine.loader import write_json_atomic
+from engine.outcome import apply_effects
+from engine.reload import ContentStore
+from main import (
+    CORE_PATH,
+    PERFECT_RUN_PATH,
+    SCENARIO_DIR,
+    parse_year,
+    advance_year,
+    calendar_distance,
+)
+
+REPO_ROOT = pathlib.Path(__file__).resolve().parent
+DEFAULT_OUT = REPO_ROOT / "fuzz_findings.json"
+
+FILLER_WORDS = ["the", "army", "council", "reform", "gold", "sparta", "and", "of", "to"]
+UNICODE_RANGES = [
+    (0x00, 0x7F),  # ASCII incl. control characters
+    (0x0300, 0x036F),  # combining marks
+    (0x0590, 0x06FF),  # Hebrew / Arabic (RTL)
+    (0x2000, 0x206F),  # general punctuation, zero-width and bidi controls
+    (0x00B2, 0x00B9),  # superscript digits (isdigit() but not int()-able)
+    (0x0660, 0x0669),  # Arabic-Indic digits
+    (0x4E00, 0x4FFF),  # CJK
+    (0x1F300, 0x1F6FF),  # emoji
+]
+
+_BLOCKS: list[dict] = []
+_KEYWORDS: list[str] = []
+
+
+def _init_worker():
+    """Load perfect blocks once per worker process."""
+    content = ContentStore(CORE_PATH, PERFECT_RUN_PATH, SCENARIO_DIR).current()
+    _BLOCKS[:] = [b for b in content.perfect_blocks.values() if b.get("ideal_actions")]
+    _BLOCKS.append({})
+    actions = [a for b in _BLOCKS for a in b.get("ideal_actions", {}).values()]
+    _KEYWORDS[:] = sorted({kw for a in actions for kw in a.get("keywords", [])})
+
+
+# ─── Generators ──────────────────────────────────────────────
+
+
+def _unicode_text(rng: random.Random, n: int) -> str:
+    out = []
+    for _ in range(n):
+        lo, hi = rng.choice(UNICODE_RANGES)
+        out.append(chr(rng.randint(lo, hi)))
+    return "".join(out)
+
+
+def _near_miss(rng: random.Random, word: str) -> str:
+    if len(word) < 2:
+        return word
+    i = rng.randrange(len(word))
+    return word[:i] + rng.choice("aeiouxz") + word[i + 1 :]
+
+
+def gen_order(rng: random.Random, max_len: int) -> tuple[str, str]:
+    """Return (strategy, order)."""
+    keywords = _KEYWORDS or FILLER_WORDS
+    strategy = rng.choice(["empty", "whitespace", "unicode", "long", "flood", "near_miss", "mixed"])
+    if strategy == "empty":
+        order = ""
+    elif strategy == "whitespace":
+        order = "".join(rng.choice(" \t\n\r\x0b\x0c 　") for _ in range(rng.randint(1, 64)))
+    elif strategy == "unicode":
+        order = _unicode_text(rng, rng.randint(1, 512))
+    elif strategy == "long":
+        words = [rng.choice(FILLER_WORDS) for _ in range(max_len // 4)]
+        order = " ".join(words)[: rng.randint(max_len // 2, max_len)]
+    elif strategy == "flood":
+        kw = rng.sample(keywords, k=min(len(keywords), rng.randint(1, 8)))
+        order = " ".join(rng.choice(kw) for _ in range(rng.randint(50, max(50, max_len // 8))))
+    elif strategy == "near_miss":
+        order = " ".join(_near_miss(rng, rng.choice(keywords)) for _ in range(rng.randint(1, 12)))
+    else:
+        noise = _unicode_text(rng, rng.randint(0, 32))
+        parts = [rng.choice(keywords), noise, rng.choice(FILLER_WORDS)]
+        rng.shuffle(parts)
+        order = " ".join(parts)
+    return strategy, order[:max_len]
+
+
+def gen_year(rng: random.Random):
+    kind = rng.choice(["int", "bc", "ad", "bare", "junk"])
+    if kind == "int":
+        return rng.choice([0, -1, 1, rng.randint(-(10**6), 10**6)])
+    n = rng.choice(["0", "1", str(rng.randint(0, 5000)), "9" * rng.randint(1, 6000)])
+    n = rng.choice([n, _unicode_text(rng, rng.randint(1, 4))])
+    if kind == "bc":
+        return rng.choice([f"{n} BC", f"{n}bc", f" {n}BC "])
+    if kind == "ad":
+        return rng.choice([f"{n} AD", f"{n}ad"])
+    if kind == "bare":
+        return rng.choice([n, f"-{n}", f"+{n}"])
+    return _unicode_text(rng, rng.randint(0, 16))
+
+
+def gen_delta(rng: random.Random) -> dict:
+    keys = ["gold", "manpower", "", "GOLD", "gold ", "population_growth", "corruption"]
+    keys += [_unicode_text(rng, rng.randint(1, 8)) for _ in range(3)]
+    return {rng.choice(keys): rng.randint(-(10**9), 10**9) for _ in range(rng.randint(0, 8))}
+
+
+# ─── Invariant checks ────────────────────────────────────────
+
+
+def _finding(case: int, check: str, value, detail: str) -> dict:
+    return {"case": case, "check": check, "input": value, "detail": detail}
+
+
+def check_order(case: int, order: str, block: dict, budget_ms: float):
+    """Return (findings, match latency in ms); latency is None if the order crashed."""
+    findings = []
+    try:
+        if tokenize(order) != tokenize(order):
+            findings.append(_finding(case, "tokenize_deterministic", order, "differs"))
+        if classify_category(order) != classify_category(order):
+            findings.append(_finding(case, "classify_deterministic", order, "differs"))
+        # Why: match_perfect_action prints on a hit; keep worker output clean.
+        with contextlib.redirect_stdout(io.StringIO()):
+            t0 = time.perf_counter()
+            first = match_perfect_action(order, block)
+            elapsed_ms = (time.perf_counter() - t0) * 1000
+            second = match_perfect_action(order, block)
+    except Exception as e:
+        return [_finding(case, "order_crash", order, f"{type(e).__name__}: {e}")], None
+    if first != second:
+        findings.append(_finding(case, "match_deterministic", order, "differs"))
+    if elapsed_ms > budget_ms:
+        findings.append(
+            _finding(case, "match_latency", order, f"{elapsed_ms:.1f} ms > {budget_ms} ms")
+        )
+    return findings, elapsed_ms
+
+
+def check_calendar(case: int, value) -> list[dict]:
+    try:
+        year = parse_year(value)
+        nxt = advance_year(year)
+        if year == 0 or nxt == 0:
+            return [_finding(case, "year_zero", value, f"parsed {year}, advanced {nxt}")]
+        if nxt <= year:
+            return [_finding(case, "advance_not_forward", value, f"{year} -> {nxt}")]
+        if calendar_distance(year, year) != 0 or calendar_distance(year, nxt) != 1:
+            return [_finding(case, "calendar_distance", value, f"{year} -> {nxt}")]
+    except Exception as e:
+        return [_finding(case, "calendar_crash", value, f"{type(e).__name__}: {e}")]
+    return []
+
+
+def check_effects(case: int, delta: dict) -> list[dict]:
+    before = {"gold": 1000, "manpower": 1000, "authority": 0}
+    try:
+        after = apply_effects(dict(before), delta)
+    except Exception as e:
+        return [_finding(case, "effects_crash", list(delta), f"{type(e).__name__}: {e}")]
+    expected_keys = set(before) | set(delta)
+    sums_ok = all(after[k] == before.get(k, 0) + v for k, v in delta.items())
+    if set(after) != expected_keys or not sums_ok:
+        return [_finding(case, "effects_arithmetic", list(delta), str(after))]
+    return []
+
+
+def run_chunk(start: int, stop: int, seed: int, budget_ms: float, max_len: int):
+    """Run cases [start, stop). Returns (findings, match latencies in ms)."""
+    if not _BLOCKS:
+        _init_worker()
+    findings, latencies = [], []
+    for case in range(start, stop):
+        rng = random.Random(f"{seed}:{case}")
+        _strategy, order = gen_order(rng, max_len)
+        block = rng.choice(_BLOCKS)
+        order_findings, elapsed_ms = check_order(case, order, block, budget_ms)
+        findings += order_findings
+        if elapsed_ms is not None:  # Why: a crash has no latency; 0.0 would skew p50/p99.
+            latencies.append(elapsed_ms)
+        findings += check_calendar(case, gen_year(rng))
+        findings += check_effects(case, gen_delta(rng))
+    return findings, latencies
+
+
+def run(cases: int, jobs: int, seed: int, budget_ms: float, max_len: int, chunk: int):
+    bounds = [(s, min(s + chunk, cases)) for s in range(0, cases, chunk)]
+    findings, latencies = [], []
+    with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker) as pool:
+        futures = [pool.submit(run_chunk, a, b, seed, budget_ms, max_len) for a, b in bounds]
+        for fut in futures:
+            f, lat = fut.result()
+            findings += f
+            latencies += lat
+    return findings, latencies
+
+
+def write_report(path: pathlib.Path, args: argparse.Namespace, findings: list[dict]):
+    """Write the run parameters and findings; overwrites any previous report."""
+    params = {
+        "seed": args.seed,
+        "cases": args.cases,
+        "max_len": args.max_len,
+        "budget_ms": args.budget_ms,
+        "jobs": args.jobs,
+    }
+    write_json_atomic({"run": params, "findings": findings}, path)
+
+
+def parse_args() -> argparse.Namespace:
+    ap = argparse.ArgumentParser(description="Fuzz the order pipeline")
+    ap.add_argument("--cases", type=int, default=10000, help="Number of generated cases.")
+    ap.add_argument("--jobs", type=int, default=os.cpu_count() or 1, help="Worker processes.")
+    ap.add_argument("--seed", type=int, default=0, help="Generator seed.")
+    ap.add_argument("--budget-ms", type=float, default=50.0, help="Matcher budget per order.")
+    ap.add_argument("--max-len", type=int, default=4000, help="Longest generated order.")
+    ap.add_argument("--chunk", type=int, default=250, help="Cases per worker task.")
+    ap.add_argument("--out", default=str(DEFAULT_OUT), help="Where to write findings (JSON).")
+    return ap.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+    t0 = time.perf_counter()
+    findings, latencies = run(
+        args.cases, args.jobs, args.seed, args.budget_ms, args.max_len, args.chunk
+    )
+    wall = time.perf_counter() - t0
+
+    latencies.sort()
+    p50 = latencies[len(latencies) // 2] if latencies else 0.0
+    p99 = latencies[int(len(latencies) * 0.99)] if latencies else 0.0
+    print(f"{args.cases} cases in {wall:.2f}s ({args.cases / wall:.0f}/s, {args.jobs} jobs)")
+    worst = max(latencies, default=0.0)
+    print(f"match latency: p50 {p50:.2f} ms | p99 {p99:.2f} ms | max {worst:.2f} ms")
+
+    # Why: always write, so a stale report from an earlier run never looks current.
+    write_report(pathlib.Path(args.out), args, findings)
+    if findings:
+        print(f"❌ {len(findings)} findings written to {args.out}")
+        return 1
+    print(f"✅ No invariant violations (report written to {args.out}).")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,18 +1,23 @@
 # main.py
+import contextlib
+import os
 from pathlib import Path
-import json
 from datetime import datetime
 
 from engine.loader import (
-    load_engine,
-    load_scenario,
-    load_perfect_run,
-    select_perfect_block,
     get_player_handles,
     save_game_state,
     load_game_state,
+    write_json_atomic,
+)
+from engine.autosave import AutosaveWriter
+from engine.reload import ContentStore
+from engine.decisions import (
+    LOWER_VARIANCE,
+    classify_category,
+    match_perfect_action,
+    apply_small_variance,
 )
-from engine.decisions import classify_category, match_perfect_action
 from engine.outcome import (
     context_modifier,
     compute_quality_score,
@@ -20,6 +25,7 @@ from engine.outcome import (
     fallback_effects,
     compose_summary,
     apply_effects,
+    MAX_FLAVOUR_VARIANCE,
 )
 
 # ─────────────────────────────────────────────────────────────
@@ -27,7 +33,8 @@ from engine.outcome import (
 ROOT = Path(__file__).parent
 CORE_PATH = ROOT / "core" / "ImperiumMundi_Engine_Core_v1.1.json"
 PERFECT_RUN_PATH = ROOT / "core" / "perfect_run.json"
-SCENARIO_PATH = ROOT / "scenarios" / "Sparta_380BC_LastKing.json"
+SCENARIO_DIR = ROOT / "scenarios"
+SCENARIO_PATH = SCENARIO_DIR / "Sparta_380BC_LastKing.json"
 
 # ─────────────────────────────────────────────────────────────
 
@@ -51,8 +58,7 @@ def check_end_conditions(resources: dict, turn: int) -> str | None:
 
 
 def save_log(entries, path: Path):
-    with path.open("w", encoding="utf-8") as f:
-        json.dump(entries, f, indent=2)
+    write_json_atomic(entries, path)
 
 
 def print_resources(resources: dict, header: str = None):
@@ -68,24 +74,30 @@ def parse_year(value) -> int:
     - '380 BC'/'380BC' -> -380
     - '379 AD'/'379AD' -> 379
     - integers pass through
+    - year 0 does not exist: '0 BC' -> -1; 0/'0'/'0 AD' -> 1, as in advance_year
     """
     if isinstance(value, int):
-        return value
+        return value or 1
     if not isinstance(value, str):
         return -380
     s = value.strip().upper().replace(" ", "")
-    if s.endswith("BC"):
-        num = s[:-2]
-        return -int(num) if num.isdigit() else -380
-    if s.endswith("AD"):
-        num = s[:-2]
-        return int(num) if num.isdigit() else 1
-    # Bare number string: assume BC if scenario title contains BC elsewhere; default to negative.
+    # Why: isdigit() accepts characters like '²' that int() rejects, and int() refuses
+    # very long digit strings; both used to crash here.
     try:
-        n = int(s)
-        return n
+        if s.endswith("BC"):
+            num = s[:-2]
+            # "0 BC" is still BC: it becomes 1 BC, never 1 AD.
+            n = -(int(num) or 1) if num.isdecimal() else -380
+        elif s.endswith("AD"):
+            num = s[:-2]
+            n = int(num) if num.isdecimal() else 1
+        else:
+            # Bare number string: assume BC if scenario title contains BC elsewhere;
+            # default to negative.
+            n = int(s)
     except ValueError:
         return -380  # defensible default for this scenario
+    return n or 1
 
 
 def display_year(year: int) -> str:
@@ -117,16 +129,39 @@ def calendar_distance(start: int, current: int) -> int:
     return raw - (1 if crosses_zero else 0)
 
 
-def main():
+def main(store: ContentStore | None = None):
+    # Why: the session registers its autosave writer here, so the writer is closed
+    # (queued saves flushed) even if the turn loop raises or is interrupted.
+    with contextlib.ExitStack() as cleanup:
+        _run_session(store, cleanup)
+
+
+def _run_session(store: ContentStore | None, cleanup: contextlib.ExitStack):
     used_perfect_actions = set()
+    # Optional outcome variance: with IMPERIAL_SEED unset, play stays fully deterministic.
+    # Why: read at call time, so a host that imports main and sets these later is honoured.
+    seed_env = os.environ.get("IMPERIAL_SEED")
+    try:
+        seed = int(seed_env) if seed_env else None
+        session = int(os.environ.get("IMPERIAL_SESSION", "0"))
+    except ValueError:
+        raise SystemExit("❌ IMPERIAL_SEED and IMPERIAL_SESSION must be integers.")
 
     # ─── Load core data ───────────────────────────────────────
-    _engine = load_engine(CORE_PATH)
-    scenario = load_scenario(SCENARIO_PATH)
-    perfect_run = load_perfect_run(PERFECT_RUN_PATH)
-    perfect_block = select_perfect_block(scenario, perfect_run)
+    # Why: a long-running host passes its own store and polls it between turns;
+    # this session stays pinned to the snapshot it starts with.
+    store = store or ContentStore(CORE_PATH, PERFECT_RUN_PATH, SCENARIO_DIR)
+    content = store.current()
+    if SCENARIO_PATH.name not in content.scenarios:
+        reason = store.load_errors.get(SCENARIO_PATH.name, "file not found")
+        raise SystemExit(f"❌ Could not load scenario {SCENARIO_PATH.name}: {reason}")
+    _engine = content.engine
+    scenario = content.scenario(SCENARIO_PATH.name)
+    perfect_run = content.perfect_run
+    perfect_block = content.perfect_blocks[SCENARIO_PATH.name]
     pf_name, pf_data = get_player_handles(scenario)
     SAVE_PATH = ROOT / f"turn_log_{pf_name.lower()}.json"
+    autosave = cleanup.enter_context(AutosaveWriter(SAVE_PATH))
 
     resources = {
         "gold": pf_data.get("resources", {}).get("gold", 1000),
@@ -184,10 +219,12 @@ def main():
             break
 
         if order.lower() == "save":
+            autosave.flush()  # Why: a queued autosave must not land after this newer save.
             save_game_state(log, SAVE_PATH)
             continue
 
         if order.lower() == "load":
+            autosave.flush()
             scenario, log = load_game_state(scenario, SAVE_PATH)
             pf_name, pf_data = get_player_handles(scenario)
             resources = pf_data.get("resources", resources)
@@ -260,7 +297,7 @@ def main():
                 band = "failure"
             else:
                 used_perfect_actions.add(action_key)
-                delta = best["effect"]
+                delta = apply_small_variance(best["effect"], LOWER_VARIANCE, seed, session, turn)
                 summary = best["summary"]
                 band = "major_success"
         else:
@@ -272,7 +309,13 @@ def main():
             idea_quality = 1
             score = compute_quality_score(base_stat, ctx_mod, idea_quality)
             band = quality_band(score)
-            delta = fallback_effects(category, band)
+            delta = apply_small_variance(
+                fallback_effects(category, band),
+                MAX_FLAVOUR_VARIANCE,
+                seed,
+                session,
+                turn,
+            )
             summary = compose_summary(category, band)
 
         resources = apply_effects(resources, delta)
@@ -303,6 +346,7 @@ def main():
         scenario["save_state"]["start_turn_year"] = (
             start_turn_year  # Why: keep for accurate reports.
         )
+        autosave.maybe_save(log)
 
         end_msg = check_end_conditions(resources, turn)
         if end_msg:
@@ -311,7 +355,8 @@ def main():
             print("Final save written as 'final_save.json'")
             break
 
-    save_log(log, SAVE_PATH)
+    autosave.submit(log)
+    autosave.close()
     print("\nSession saved to turn_log.json")
     print("Thank you for playing Imperial Dynasties.")
 
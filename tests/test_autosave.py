@@ -0,0 +1,82 @@
+import json
+import os
+import stat
+import time
+
+from engine.autosave import AutosaveWriter
+from engine.loader import write_json_atomic
+
+
+def test_write_json_atomic_replaces_file(tmp_path):
+    """Atomic write leaves only the final file behind"""
+    path = tmp_path / "save.json"
+    write_json_atomic([{"turn": 1}], path)
+    write_json_atomic([{"turn": 1}, {"turn": 2}], path)
+
+    assert json.loads(path.read_text(encoding="utf-8")) == [{"turn": 1}, {"turn": 2}]
+    assert [p.name for p in tmp_path.iterdir()] == ["save.json"]
+
+
+def test_autosave_writes_latest_snapshot_on_close(tmp_path):
+    """Pending snapshots coalesce and close() flushes the newest one"""
+    path = tmp_path / "turn_log.json"
+    writer = AutosaveWriter(path, every_turns=2, interval_seconds=0)
+    log = []
+    for turn in range(1, 6):
+        log.append({"turn": turn})
+        writer.maybe_save(log)
+    writer.submit(log)
+    writer.close()
+
+    assert json.loads(path.read_text(encoding="utf-8")) == log
+
+
+def test_autosave_time_trigger_saves_while_idle(tmp_path):
+    """Unsaved turns are written once the interval expires, without another turn"""
+    path = tmp_path / "turn_log.json"
+    writer = AutosaveWriter(path, every_turns=5, interval_seconds=0.05)
+    log = [{"turn": 1}, {"turn": 2}]
+    writer.maybe_save(log[:1])
+    writer.maybe_save(log)
+
+    deadline = time.monotonic() + 5
+    while not path.exists() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert json.loads(path.read_text(encoding="utf-8")) == log
+    writer.close()
+
+
+def test_autosave_close_writes_unsaved_turns(tmp_path):
+    """close() writes dirty turns that never reached either threshold"""
+    path = tmp_path / "turn_log.json"
+    writer = AutosaveWriter(path, every_turns=5, interval_seconds=0)
+    writer.maybe_save([{"turn": 1}])
+    writer.close()
+
+    assert json.loads(path.read_text(encoding="utf-8")) == [{"turn": 1}]
+
+
+def test_write_json_atomic_keeps_normal_permissions(tmp_path):
+    """New saves follow the umask and existing saves keep their mode"""
+    path = tmp_path / "save.json"
+    umask = os.umask(0)
+    os.umask(umask)
+    write_json_atomic([], path)
+    assert stat.S_IMODE(path.stat().st_mode) == 0o666 & ~umask
+
+    os.chmod(path, 0o640)
+    write_json_atomic([{"turn": 1}], path)
+    assert stat.S_IMODE(path.stat().st_mode) == 0o640
+
+
+def test_autosave_context_manager_flushes_on_error(tmp_path):
+    """Leaving the with-block through an exception still writes queued turns"""
+    path = tmp_path / "turn_log.json"
+    try:
+        with AutosaveWriter(path, every_turns=5, interval_seconds=0) as writer:
+            writer.maybe_save([{"turn": 1}])
+            raise KeyboardInterrupt
+    except KeyboardInterrupt:
+        pass
+
+    assert json.loads(path.read_text(encoding="utf-8")) == [{"turn": 1}]
@@ -0,0 +1,57 @@
+import argparse
+import json
+
+import fuzz_orders
+from main import parse_year
+
+
+def test_fuzz_chunk_has_no_invariant_violations():
+    """Short orders with a generous budget pass every invariant"""
+    findings, latencies = fuzz_orders.run_chunk(0, 300, seed=1, budget_ms=1000.0, max_len=200)
+    assert findings == []
+    assert len(latencies) == 300
+
+
+def test_calendar_regressions():
+    """Inputs that used to crash parse_year or yield year 0"""
+    for value in [0, "0", "0 BC", "²BC", "9" * 5000 + "BC", "٣٨٠ BC"]:
+        assert fuzz_orders.check_calendar(0, value) == []
+    assert parse_year("0 BC") == -1
+    assert parse_year("0bc") == -1
+    assert parse_year("0 AD") == 1
+    assert parse_year("0") == 1
+    assert parse_year(0) == 1
+
+
+def test_crashed_orders_have_no_latency(monkeypatch):
+    """A crash is a finding, not a 0 ms sample"""
+
+    def boom(order, block):
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(fuzz_orders, "match_perfect_action", boom)
+    findings, elapsed_ms = fuzz_orders.check_order(0, "march", {}, budget_ms=50.0)
+    assert [f["check"] for f in findings] == ["order_crash"]
+    assert elapsed_ms is None
+
+
+def test_generation_is_reproducible():
+    """A case depends only on (seed, index)"""
+    a = fuzz_orders.run_chunk(10, 20, seed=5, budget_ms=1000.0, max_len=100)[0]
+    b = fuzz_orders.run_chunk(10, 20, seed=5, budget_ms=1000.0, max_len=100)[0]
+    assert a == b
+
+
+def test_report_is_written_with_run_parameters(tmp_path):
+    """A clean run overwrites an old report and records how to reproduce it"""
+    out = tmp_path / "fuzz_findings.json"
+    out.write_text('[{"case": 1, "check": "stale"}]', encoding="utf-8")
+    args = argparse.Namespace(seed=3, cases=10, max_len=50, budget_ms=20.0, jobs=1)
+
+    fuzz_orders.write_report(out, args, [])
+
+    report = json.loads(out.read_text(encoding="utf-8"))
+    assert report == {
+        "run": {"seed": 3, "cases": 10, "max_len": 50, "budget_ms": 20.0, "jobs": 1},
+        "findings": [],
+    }
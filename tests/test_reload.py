@@ -0,0 +1,80 @@
+import json
+import os
+
+from engine.reload import ContentStore
+
+
+def _write(path, data, bump_ns=0):
+    path.write_text(json.dumps(data), encoding="utf-8")
+    if bump_ns:
+        st = path.stat()
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + bump_ns))
+
+
+def _content(tmp_path):
+    core = tmp_path / "core.json"
+    perfect = tmp_path / "perfect_run.json"
+    scenarios = tmp_path / "scenarios"
+    scenarios.mkdir()
+    _write(core, {"rules": 1})
+    _write(perfect, {"Sparta_380BC": {"ideal_actions": {"a": {"keywords": ["reform"]}}}})
+    _write(scenarios / "Sparta_380BC_Test.json", {"factions": {"Sparta": {}}})
+    _write(scenarios / "Athens_400BC_Test.json", {"factions": {"Athens": {}}})
+    return core, perfect, scenarios
+
+
+def test_poll_reloads_only_changed_scenario(tmp_path):
+    """Editing one scenario swaps in a new snapshot; held snapshots are untouched"""
+    core, perfect, scenarios = _content(tmp_path)
+    store = ContentStore(core, perfect, scenarios)
+    pinned = store.current()
+    assert store.poll() == set()
+
+    _write(scenarios / "Athens_400BC_Test.json", {"factions": {"Athens": {"x": 1}}}, bump_ns=10**9)
+    assert store.poll() == {"Athens_400BC_Test.json"}
+
+    fresh = store.current()
+    assert fresh.version == pinned.version + 1
+    assert fresh.scenarios["Athens_400BC_Test.json"]["factions"]["Athens"] == {"x": 1}
+    assert pinned.scenarios["Athens_400BC_Test.json"]["factions"]["Athens"] == {}
+    assert fresh.scenarios["Sparta_380BC_Test.json"] is pinned.scenarios["Sparta_380BC_Test.json"]
+
+
+def test_poll_rebuilds_perfect_blocks_and_skips_bad_json(tmp_path):
+    """A perfect_run edit rebuilds blocks; a half-written file keeps the old version"""
+    core, perfect, scenarios = _content(tmp_path)
+    store = ContentStore(core, perfect, scenarios)
+
+    _write(perfect, {"Sparta_380BC": {"ideal_actions": {"b": {}}}}, bump_ns=10**9)
+    assert store.poll() == {"perfect_run.json"}
+    assert "b" in store.current().perfect_blocks["Sparta_380BC_Test.json"]["ideal_actions"]
+
+    core.write_text("{not json", encoding="utf-8")
+    assert store.poll() == set()
+    assert store.current().engine == {"rules": 1}
+
+
+def test_bad_scenarios_are_skipped_not_fatal(tmp_path):
+    """Non-object JSON and non-UTF-8 bytes never take the store down"""
+    core, perfect, scenarios = _content(tmp_path)
+    (scenarios / "Broken_1_List.json").write_text("[1, 2]", encoding="utf-8")
+    store = ContentStore(core, perfect, scenarios)
+    assert "Broken_1_List.json" not in store.current().scenarios
+    assert "Sparta_380BC_Test.json" in store.current().scenarios
+
+    (scenarios / "Athens_400BC_Test.json").write_bytes(b'{"x": "\xff\xfe"}')
+    assert store.poll() == set()
+    assert store.current().scenarios["Athens_400BC_Test.json"]["factions"] == {"Athens": {}}
+
+    _write(scenarios / "Broken_1_List.json", {"factions": {}}, bump_ns=10**9)
+    assert store.poll() == {"Broken_1_List.json"}
+
+
+def test_load_errors_name_the_failing_file(tmp_path):
+    """Callers can tell why a scenario is missing from the snapshot"""
+    core, perfect, scenarios = _content(tmp_path)
+    (scenarios / "Sparta_380BC_Test.json").write_text("{oops", encoding="utf-8")
+    store = ContentStore(core, perfect, scenarios)
+
+    assert "Sparta_380BC_Test.json" not in store.current().scenarios
+    assert "Expecting property name" in store.load_errors["Sparta_380BC_Test.json"]